@@ -0,0 +1,235 @@
+"""Benchmark suite for the rendering, identify and legend operations of the geolayer library"""
+# Author(s): Davide.De-Marchi@ec.europa.eu
+# Copyright © European Union 2026
+# 
+# Licensed under the EUPL, Version 1.2 or as soon they will be approved by 
+# the European Commission subsequent versions of the EUPL (the "Licence");
+# 
+# You may not use this work except in compliance with the Licence.
+# 
+# You may obtain a copy of the Licence at:
+# https://joinup.ec.europa.eu/collection/eupl/eupl-text-eupl-12
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the Licence is distributed on an "AS IS"
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either
+# express or implied.
+# 
+# See the Licence for the specific language governing permissions and
+# limitations under the Licence.
+
+
+
+#####################################################################################################################################################
+# Generation of synthetic datasets
+#####################################################################################################################################################
+
+# Create a synthetic GeoTIFF file
+def createRaster(filepath, size=4096, dtype='Float32', overviews=True, nodata=0.0, epsg=3035):
+    """
+    Create a synthetic single band GeoTIFF file to be used in the benchmarks.
+
+    Parameters
+    ----------
+    filepath : str
+        Full path of the GeoTIFF file to create.
+    size : int, optional
+        Number of rows and columns of the raster (default is 4096).
+    dtype : str, optional
+        GDAL data type of the band (one of 'Byte', 'UInt16', 'Int16', 'UInt32', 'Int32', 'Float32', 'Float64'). Default is 'Float32'.
+    overviews : bool, optional
+        If True, the internal overviews are created (default is True).
+    nodata : float, optional
+        Nodata value of the band (default is 0.0). About 10% of the pixels are set to the nodata value.
+    epsg : int, optional
+        EPSG code of the coordinate system of the raster (default is 3035).
+    """
+    pass
+
+
+# Create a synthetic vector file
+def createVector(filepath, features=10000, vertices=100, geometry='Polygon', epsg=4326):
+    """
+    Create a synthetic vector file (shapefile or geopackage, depending on the extension of the filepath) to be used in the benchmarks. Each feature has an integer field 'id', a string field 'category' having 10 distinct values and a float field 'value'.
+
+    Parameters
+    ----------
+    filepath : str
+        Full path of the vector file to create (.shp or .gpkg).
+    features : int, optional
+        Number of features to create (default is 10000).
+    vertices : int, optional
+        Number of vertices of each polygon or polyline (default is 100). Ignored for points.
+    geometry : str, optional
+        Type of the features: 'Polygon', 'Polyline' or 'Point' (default is 'Polygon').
+    epsg : int, optional
+        EPSG code of the coordinate system of the features (default is 4326).
+    """
+    pass
+
+
+# Create a list of synthetic WKT strings
+def createWKT(features=1000, vertices=100, geometry='Polygon'):
+    """
+    Create a list of synthetic WKT strings in geographic coordinates to be used in the benchmarks of :py:meth:`vectorlayer.vectorlayer.wkt` instances.
+
+    Parameters
+    ----------
+    features : int, optional
+        Number of WKT strings to create (default is 1000).
+    vertices : int, optional
+        Number of vertices of each polygon or polyline (default is 100). Ignored for points.
+    geometry : str, optional
+        Type of the features: 'Polygon', 'Polyline' or 'Point' (default is 'Polygon').
+
+    Returns
+    --------
+    wktlist : list of str
+        List of WKT strings.
+    """
+    pass
+
+
+#####################################################################################################################################################
+# Measures
+#####################################################################################################################################################
+
+# Measure the rendering of tiles of a layer
+def tiles(layer, zooms=[6, 10, 14], count=100):
+    """
+    Measure the rendering of tiles of a rasterlayer or vectorlayer instance. For each zoom level, count tiles inside the extent of the dataset are rendered without using any cache.
+
+    Parameters
+    ----------
+    layer : rasterlayer or vectorlayer
+        Instance of the layer to measure.
+    zooms : list of int, optional
+        Zoom levels to measure (default is [6, 10, 14]).
+    count : int, optional
+        Number of tiles to render for each zoom level (default is 100).
+
+    Returns
+    --------
+    results : dict
+        Dictionary having the zoom levels as keys and, as values, dicts containing the keys: tiles_per_second, p50, p90, p99 and max (rendering times in milliseconds).
+    """
+    pass
+
+
+# Measure the identify operation of a layer
+def identify(layer, zoom=10, count=100):
+    """
+    Measure the latency of the identify operation of a rasterlayer or vectorlayer instance on count random points inside the extent of the dataset.
+
+    Parameters
+    ----------
+    layer : rasterlayer or vectorlayer
+        Instance of the layer to measure.
+    zoom : int, optional
+        Zoom level passed to the identify operation (default is 10).
+    count : int, optional
+        Number of identify operations to execute (default is 100).
+
+    Returns
+    --------
+    results : dict
+        Dictionary containing the keys: calls_per_second, p50, p90, p99 and max (latencies in milliseconds).
+    """
+    pass
+
+
+# Measure the creation of legends of a vectorlayer
+def legends(vlayer, fieldname='value', categoryfield='category', colorlist=['#ffffcc', '#a1dab4', '#41b6c4', '#2c7fb8', '#253494'], count=10):
+    """
+    Measure the creation of legends of a vectorlayer instance: the calls to :py:meth:`vectorlayer.vectorlayer.legendCategories` on a categorical field, to :py:meth:`vectorlayer.vectorlayer.legendGraduated` on a numerical field and to :py:meth:`vectorlayer.vectorlayer.legend2Image` on both the legends created.
+
+    Parameters
+    ----------
+    vlayer : vectorlayer
+        Instance of the vectorlayer to measure.
+    fieldname : str, optional
+        Name of the numerical field used to create the graduated legend (default is 'value', the float field of the datasets created by :py:func:`bench.createVector`).
+    categoryfield : str, optional
+        Name of the field having a limited number of distinct values used to create the categories legend (default is 'category', the field having 10 distinct values of the datasets created by :py:func:`bench.createVector`).
+    colorlist : list of str, optional
+        List of colors used to create the legends.
+    count : int, optional
+        Number of times each legend is created (default is 10).
+
+    Returns
+    --------
+    results : dict
+        Dictionary having the names of the methods as keys and, as values, dicts containing the keys: p50, p90, p99 and max (times in milliseconds).
+    """
+    pass
+
+
+# Measure the import time of the modules of the library
+def importTime(modules=['geolayer.rasterlayer', 'geolayer.vectorlayer'], budget=0.5, count=5, check=False):
+    """
+    Measure the time needed to import the modules of the geolayer library, each one in a new Python process. The heavy dependencies are loaded only when a method that needs them is called for the first time, so that processes that only use the identify and info methods don't pay the import cost of the libraries used for the rendering and the legends (Mapnik, PIL, ipyvuetify, ipyleaflet, mapclassify and plotly). GDAL/OGR is still needed by those methods to open the datasets. This function can be used to verify that the import time remains within a budget.
+
+    Parameters
+    ----------
+    modules : list of str, optional
+        Names of the modules to import (default is ['geolayer.rasterlayer', 'geolayer.vectorlayer']).
+    budget : float, optional
+        Maximum median import time in seconds allowed for each module (default is 0.5). Passing None disables the comparison with the budget.
+    count : int, optional
+        Number of times each module is imported (default is 5).
+    check : bool, optional
+        If True, an AssertionError is raised if the median import time of any module exceeds the budget, after all the modules have been measured (default is False, meaning that the result of the comparison is only recorded in the returned dict).
+
+    Returns
+    --------
+    results : dict
+        Dictionary having the names of the modules as keys and, as values, dicts containing the keys: p50 and max (times in seconds), within_budget (True, False, or None if no budget is passed) and the list of heavy dependencies loaded by the import.
+    """
+    pass
+
+
+#####################################################################################################################################################
+# Run the whole benchmark suite
+#####################################################################################################################################################
+def run(outputfile='geolayer_bench.json', folder=None, sizes=[1024, 8192], dtypes=['Byte', 'Float32'], features=[1000, 100000], vertices=[10, 1000], count=100, budget=0.5, check=False):
+    """
+    Run the whole benchmark suite: synthetic datasets are created in a temporary folder and the rendering of tiles of :py:meth:`rasterlayer.rasterlayer.single`, :py:meth:`rasterlayer.rasterlayer.rgb` and colormap rasterlayer instances and of symbolized vectorlayer instances, the identify operations, the creation of legends and the import time of the modules (see :py:func:`bench.importTime`) are measured. The results, together with the versions of the geolayer library and of its dependencies, are written in a JSON file that can be compared with the results of previous runs.
+
+    Parameters
+    ----------
+    outputfile : str, optional
+        Path of the JSON file where the results are written (default is 'geolayer_bench.json').
+    folder : str, optional
+        Folder where the synthetic datasets are created (default is None, meaning that a temporary folder is used and removed at the end).
+    sizes : list of int, optional
+        Sizes of the synthetic rasters, created with and without overviews (default is [1024, 8192]).
+    dtypes : list of str, optional
+        GDAL data types of the synthetic rasters (default is ['Byte', 'Float32']).
+    features : list of int, optional
+        Number of features of the synthetic vector datasets (default is [1000, 100000]).
+    vertices : list of int, optional
+        Number of vertices of the features of the synthetic vector datasets (default is [10, 1000]).
+    count : int, optional
+        Number of tiles rendered for each zoom level and number of identify operations (default is 100).
+    budget : float, optional
+        Maximum median import time in seconds allowed for each module (default is 0.5). Passing None disables the comparison with the budget.
+    check : bool, optional
+        If True, an AssertionError is raised if the import time of any module exceeds the budget. The exception is raised only after the results have been written in the outputfile, so that no measure is lost (default is False).
+
+    Returns
+    --------
+    results : dict
+        Dictionary containing all the results of the benchmarks (the same content written in the outputfile). The top-level key 'import_within_budget' is False if the import time of any module exceeds the budget, True otherwise (None if no budget is passed), so that an automated comparison can fail on it without inspecting the single modules.
+
+    Example
+    -------
+    Run the benchmark suite and display the results::
+
+        # Import libraries
+        from IPython.display import display
+        from geolayer import bench
+
+        results = bench.run('results.json')
+        display(results)
+    """
+    pass
@@ -0,0 +1,115 @@
+"""Persistent catalog of the metadata of raster and vector files"""
+# Author(s): Davide.De-Marchi@ec.europa.eu
+# Copyright © European Union 2026
+# 
+# Licensed under the EUPL, Version 1.2 or as soon they will be approved by 
+# the European Commission subsequent versions of the EUPL (the "Licence");
+# 
+# You may not use this work except in compliance with the Licence.
+# 
+# You may obtain a copy of the Licence at:
+# https://joinup.ec.europa.eu/collection/eupl/eupl-text-eupl-12
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the Licence is distributed on an "AS IS"
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either
+# express or implied.
+# 
+# See the Licence for the specific language governing permissions and
+# limitations under the Licence.
+
+
+
+#####################################################################################################################################################
+# Configuration of the catalog
+#####################################################################################################################################################
+def setup(dbpath='~/.geolayer/catalog.sqlite', enabled=True):
+    """
+    Configure the persistent catalog of metadata. The catalog is a local SQLite database that stores the results of :py:meth:`rasterlayer.rasterlayer.info`, :py:meth:`vectorlayer.vectorlayer.layers` and :py:meth:`vectorlayer.vectorlayer.layer` (extent, feature count, EPSG code, etc.). Each file is identified by its path, modification time and size: the metadata of a file is read from the catalog if the file is unchanged, otherwise the file is inspected again and the catalog is updated.
+
+    The catalog is disabled until this function is called: no database file is created or written by processes that never call it.
+
+    The database is opened in WAL (write-ahead log) mode, so that readers are never blocked by a writer. Many processes can use the same database file: each write is a short transaction and, if the database is locked by another process, it is retried for up to 5 seconds; after that the metadata is returned to the caller without being stored in the catalog.
+
+    Parameters
+    ----------
+    dbpath : str, optional
+        Path of the SQLite database file (default is '~/.geolayer/catalog.sqlite'). The file is created if it doesn't exist.
+    enabled : bool, optional
+        If False, the catalog is disabled again and all the files are inspected on every call (default is True).
+    """
+    pass
+
+
+#####################################################################################################################################################
+# Indexing of an archive
+#####################################################################################################################################################
+def scan(directory, workers=8, recursive=True, extensions=['.tif', '.tiff', '.vrt', '.nc', '.shp', '.gpkg', '.sqlite']):
+    """
+    Index all the raster and vector files of a directory in the catalog (see :py:func:`catalog.setup`, which must be called before). The files are inspected in parallel by the worker processes, which don't access the database: the metadata they return is written by the calling process alone, in transactions of 1000 files, so that there is a single writer. The files already present in the catalog and unchanged are skipped. The files that are no longer present in the directory are removed from the catalog.
+
+    Parameters
+    ----------
+    directory : str
+        Path of the directory to index.
+    workers : int, optional
+        Number of processes used to inspect the files in parallel (default is 8).
+    recursive : bool, optional
+        If True, the subdirectories are also indexed (default is True).
+    extensions : list of str, optional
+        Extensions of the files to index.
+
+    Returns
+    --------
+    info : dict
+        Dictionary containing the number of files added, updated, unchanged, removed and the number of files that could not be opened.
+
+    Example
+    -------
+    Index an archive of files::
+
+        # Import libraries
+        from IPython.display import display
+        from geolayer import catalog
+
+        info = catalog.scan('/eos/jeodpp/data/base/Energy/EUROPE', workers=32)
+        display(info)
+    """
+    pass
+
+
+#####################################################################################################################################################
+# Query of the catalog
+#####################################################################################################################################################
+def query(bbox=None, epsg=None, kind=None, directory=None):
+    """
+    Returns the metadata of the files of the catalog that satisfy all the conditions passed (see :py:func:`catalog.setup`, which must be called before).
+
+    Parameters
+    ----------
+    bbox : tuple of 4 floats, optional
+        Bounding box (lonmin, latmin, lonmax, latmax) in geographic coordinates. Only the files whose extent intersects the bounding box are returned. Default is None.
+    epsg : int, optional
+        EPSG code of the coordinate system of the files to return (default is None).
+    kind : str, optional
+        Type of the files to return: 'raster' or 'vector' (default is None, meaning both types).
+    directory : str, optional
+        Only the files contained in this directory (or in its subdirectories) are returned (default is None).
+
+    Returns
+    --------
+    files : list of dicts
+        List of the metadata of the files, each one containing the keys: filepath, kind, layer, epsg, extent (lonmin, latmin, lonmax, latmax in geographic coordinates EPSG:4326, the same used by the bbox parameter), mtime, size and info (which also contains the extent in the coordinate system of the file) (the dict returned by :py:meth:`rasterlayer.rasterlayer.info` or :py:meth:`vectorlayer.vectorlayer.layer`).
+
+    Example
+    -------
+    Query all the rasters in EPSG:3035 that intersect an area::
+
+        # Import libraries
+        from geolayer import catalog
+
+        files = catalog.query(bbox=(10.0, 43.0, 13.0, 45.0), epsg=3035, kind='raster')
+        for f in files:
+            print(f['filepath'])
+    """
+    pass
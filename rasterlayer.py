@@ -1,4 +1,7 @@
-"""Display of raster datasets (.tif, .vrt, .nc, and all other formats managed by the GDAL library)"""
+"""Display of raster datasets (.tif, .vrt, .nc, and all other formats managed by the GDAL library)
+
+The heavy dependencies (GDAL, Mapnik, PIL and ipyleaflet) are not imported when this module is imported: each of them is loaded the first time a method that needs it is called. Processes that only use the identify and info methods don't pay the import cost of the libraries used for the rendering.
+"""
 # Author(s): Davide.De-Marchi@ec.europa.eu
 # Copyright © European Union 2022-2024
 # 
@@ -31,6 +34,7 @@ class rasterlayer:
     
     - :py:meth:`~rasterlayer.single`
     - :py:meth:`~rasterlayer.rgb`
+    - :py:meth:`~rasterlayer.expression`
     
     For Sentinel-2 L2A products, these class methods can be used:
     
@@ -76,10 +80,17 @@ class rasterlayer:
                identify_dict=None,           # Dictionary to convert integer pixel values to strings (e.g. classes names)
                identify_integer=False,       # True if the identify operation should convert pixels values to integer
                identify_digits=6,            # Number of digits for identify of float values
-               identify_label='Value'):      # Label for identify operation
+               identify_label='Value',       # Label for identify operation
+               coverage=True,                # True to skip the tiles that fall entirely in nodata areas
+               memorymap='auto',             # Memory-mapped read of uncompressed rasters: 'auto', True or False
+               lazy=False):                  # True to delay the opening of the dataset to the first use
         """
         Single layer raster display. 
         
+        A coarse map of the coverage of the raster is built and cached: a low resolution bitmap of the valid pixels read from the smallest overview of the raster, or the footprints of the sources in case of a VRT file. The full resolution pixels are never read to build the coverage map: if the raster is neither a VRT file nor has overviews, no coverage map is built and all the tiles are rendered. The coverage map is built when the rasterlayer instance is created or, if lazy is True, when the first tile is requested. It is identified by the path, the modification time and the size of the raster file (of the VRT file for a VRT mosaic), and it is built again when the file is modified, so that the areas where new data has been added are not hidden. The tiles that fall entirely in nodata areas are then returned as a shared empty tile without reading the raster file. This makes the display of sparse datasets much faster.
+        
+        Uncompressed rasters (tiled or striped GeoTIFF files and ENVI or raw binary files) can be read by mapping the file in memory: the windows needed by each tile are accessed as views on the mapped file, without copies through the GDAL block cache, and the overviews selection and colorization work directly on these views.
+        
         Parameters
         ----------
         filepath : str
@@ -100,6 +111,12 @@ class rasterlayer:
             Number of digits for the identify of float values (default is 6).
         identify_label : str, optional
             Label for identify operation (default is 'Value')
+        coverage : bool, optional
+            If True, the coverage map of the raster is built from its overviews or VRT sources footprints and used to skip the tiles that fall entirely in nodata areas (default is True).
+        memorymap : str or bool, optional
+            Memory-mapped read of the raster file. If 'auto' the file is memory-mapped only if it is uncompressed and stored locally, if True the memory-mapped read is requested (an exception is raised if the file is compressed), if False the file is always read by GDAL. Default is 'auto'.
+        lazy : bool, optional
+            If True, the creation of the instance only records its parameters and the dataset is opened (and the coverage map is built) only when the first tile is rendered or the first information on the dataset is requested (default is False).
             
         Example
         -------
@@ -147,10 +164,14 @@ class rasterlayer:
             scalemin=None,   # Single float or array of 3 floats
             scalemax=None,   # Single float or array of 3 floats
             scaling='near',
-            opacity=1.0):
+            opacity=1.0,
+            workers=3,       # Number of threads for the concurrent read of the three bands
+            lazy=False):     # True to delay the opening of the dataset to the first use
         """
         RGB composition of three bands of a raster dataset. 
         
+        For each tile the three bands are read concurrently using a pool of threads (or asynchronous requests for remote files and Cloud Optimized GeoTIFFs accessed through /vsicurl/) and decoded directly into a single preallocated (3, height, width) buffer. If the raster file is pixel-interleaved, the three bands are obtained by a single interleaved read so that each block of the file is decoded only once.
+        
         Parameters
         ----------
         filepath : str
@@ -173,6 +194,10 @@ class rasterlayer:
             Maximum scaling value to convert from raster values to the interval [0,255] (default is None)
         opacity : float, optional
             Opacity value (from 0.0 to 1.0) to display the RGB composition with partial transparency (default is 1.0, fully opaque)
+        workers : int, optional
+            Number of threads to use for the concurrent read of the three bands (default is 3). Passing 1 reads the bands sequentially. It is ignored if the raster file is pixel-interleaved.
+        lazy : bool, optional
+            If True, the creation of the instance only records its parameters and the dataset is opened only when the first tile is rendered or the first information on the dataset is requested (default is False).
             
         Example
         -------
@@ -219,7 +244,8 @@ class rasterlayer:
                         scalemax=None,
                         colorlist=['#000000','#ffffff'],
                         scaling='near',
-                        opacity=1.0):
+                        opacity=1.0,
+                        lazy=False):
         """
         Display a single band of a Sentinel-2 L2A product. The input product can be selected by passing its Product ID string (i.e: 'S2A_MSIL2A_20230910T100601_N0509_R022_T32TQP_20230910T161500') or the dict returned by a call to the :py:meth:`~rasterlayer.sentinel2item` method.
         
@@ -241,6 +267,8 @@ class rasterlayer:
             Scaling mode (one of 'near', 'fast', 'bilinear', 'bicubic', 'spline16', 'spline36', 'hanning', 'hamming', 'hermite', 'kaiser', 'quadric', 'catrom', 'gaussian', 'bessel', 'mitchell', 'sinc', 'lanczos', 'blackman'). Default is 'near'.
         opacity : float, optional
             Opacity value (from 0.0 to 1.0) to display raster with partial transparency (default is 1.0, fully opaque).
+        lazy : bool, optional
+            If True, the creation of the instance only records its parameters and the STAC item of the product is queried, and the bands opened, only when the first tile is rendered or the first information on the product is requested (default is False).
             
         Example
         -------
@@ -287,7 +315,8 @@ class rasterlayer:
                      scalemin=None,   # Single float or array of 3 floats
                      scalemax=None,   # Single float or array of 3 floats
                      scaling='near',
-                     opacity=1.0):
+                     opacity=1.0,
+                     lazy=False):     # True to delay the query of the STAC item to the first use
         """
         Display an RGB three bands composition of a Sentinel-2 L2A product. The input product can be selected by passing its Product ID string (i.e: 'S2A_MSIL2A_20230910T100601_N0509_R022_T32TQP_20230910T161500') or the dict returned by a call to the :py:meth:`~rasterlayer.sentinel2item` method.
         
@@ -311,6 +340,8 @@ class rasterlayer:
             Scaling mode (one of 'near', 'fast', 'bilinear', 'bicubic', 'spline16', 'spline36', 'hanning', 'hamming', 'hermite', 'kaiser', 'quadric', 'catrom', 'gaussian', 'bessel', 'mitchell', 'sinc', 'lanczos', 'blackman'). Default is 'near'.
         opacity : float, optional
             Opacity value (from 0.0 to 1.0) to display raster with partial transparency (default is 1.0, fully opaque).
+        lazy : bool, optional
+            If True, the creation of the instance only records its parameters and the STAC item of the product is queried, and the bands opened, only when the first tile is rendered or the first information on the product is requested (default is False).
             
         Example
         -------
@@ -351,9 +382,10 @@ class rasterlayer:
                        scalemax=0.75,
                        colorlist=['#784519', '#ffb24a', '#ffeda6', '#ade85e', '#87b540', '#039c00', '#016400', '#015000'],  # BDAP standard NDVI palette
                        scaling='near',
-                       opacity=1.0):
+                       opacity=1.0,
+                       lazy=False):     # True to delay the query of the STAC item to the first use
         """
-        Display an index calculated from 2 bands (b1 - b2)/(b1 + b2) of a Sentinel-2 L2A product. The input product can be selected by passing its Product ID string (i.e: 'S2A_MSIL2A_20230910T100601_N0509_R022_T32TQP_20230910T161500') or the dict returned by a call to the :py:meth:`~rasterlayer.sentinel2item` method. The index calculation returns pixel values in the range [-1, 1].
+        Display an index calculated from 2 bands (b1 - b2)/(b1 + b2) of a Sentinel-2 L2A product. The input product can be selected by passing its Product ID string (i.e: 'S2A_MSIL2A_20230910T100601_N0509_R022_T32TQP_20230910T161500') or the dict returned by a call to the :py:meth:`~rasterlayer.sentinel2item` method. The index calculation returns pixel values in the range [-1, 1]. To display indices having a different formula (EVI, SAVI, etc.) use the :py:meth:`~rasterlayer.expression` method.
         
         The assignment of colors to the pixel values is done by linearly mapping the range of pixel values [scalemin, scalemax] to the color ramp.
         
@@ -375,6 +407,8 @@ class rasterlayer:
             Scaling mode (one of 'near', 'fast', 'bilinear', 'bicubic', 'spline16', 'spline36', 'hanning', 'hamming', 'hermite', 'kaiser', 'quadric', 'catrom', 'gaussian', 'bessel', 'mitchell', 'sinc', 'lanczos', 'blackman'). Default is 'near'.
         opacity : float, optional
             Opacity value (from 0.0 to 1.0) to display raster with partial transparency (default is 1.0, fully opaque).
+        lazy : bool, optional
+            If True, the creation of the instance only records its parameters and the STAC item of the product is queried, and the bands opened, only when the first tile is rendered or the first information on the product is requested (default is False).
             
         Example
         -------
@@ -408,6 +442,101 @@ class rasterlayer:
         pass
     
     
+    #####################################################################################################################################################
+    # Display the result of a band-math expression on bands of a generic raster file or of a Sentinel-2 product
+    #####################################################################################################################################################
+    @classmethod
+    def expression(cls,
+                   expression,                  # String containing the expression, i.e. "(B08-B04)/(B08+B04)"
+                   bands={},                    # Dict having key: name of variable in the expression, value: (filepath, band) tuple
+                   stacitem=None,               # STAC item of a Sentinel-2 product (variables named as the bands, i.e. 'B04')
+                   constants={},                # Dict having key: name of constant in the expression, value: float
+                   epsg=None,                   # Forced epsg that has prevalence over the epsg read from the raster files
+                   proj='',                     # To be used for projections that do not have an EPSG code (if not empty it is used instead of the passed epsg)
+                   nodata=None,                 # Forced nodata that has prevalence over nodata read from the raster files
+                   scalemin=0,
+                   scalemax=0.75,
+                   colorlist=['#784519', '#ffb24a', '#ffeda6', '#ade85e', '#87b540', '#039c00', '#016400', '#015000'],  # BDAP standard NDVI palette
+                   scaling='near',
+                   opacity=1.0,
+                   lazy=False):                 # True to delay the opening of the datasets to the first use
+        """
+        Display the result of a band-math expression calculated on the bands of any raster dataset managed by the GDAL library, or on the bands of a Sentinel-2 L2A product. Indices like EVI, SAVI, NBR, etc. can be displayed without the need to pre-calculate a raster on disk.
+
+        The expression is parsed only once, at the creation of the rasterlayer instance, and compiled into a vectorized kernel that is evaluated on each tile. The input bands are read on windows aligned to the blocks of the raster files and the output buffers are reused from one tile to the next one. The supported syntax includes the arithmetic operators ``+``, ``-``, ``*``, ``/``, ``**``, the parenthesis, numeric literals and the functions abs, sqrt, log, exp, min and max. The variables of the expression are the keys of the bands dict (or the Sentinel-2 band names, i.e. 'B04', if a stacitem is passed) and the keys of the constants dict.
+
+        A pixel of the result is considered absence of data if it is nodata in any of the input bands or if the expression evaluates to a non-finite value (i.e. a division by zero).
+
+        The assignment of colors to the pixel values is done by linearly mapping the range of pixel values [scalemin, scalemax] to the color ramp.
+
+        Parameters
+        ----------
+        expression : str
+            Band-math expression to calculate (i.e. '(B08-B04)/(B08+B04)').
+        bands : dict, optional
+            Dictionary that assigns to each variable name used in the expression a tuple (filepath, band) to identify the band of a raster file to read (band numbers start from 1). It can be omitted if a stacitem is passed. Default is the empty dict.
+        stacitem : str or dict, optional
+            Product ID string of the Sentinel-2 L2A product or the dict returned by a call to the :py:meth:`~rasterlayer.sentinel2item` method containing the product metadata. If passed, all the Sentinel-2 band names (i.e. 'B02', 'B8A', 'B11') can be used as variables in the expression. Default is None.
+        constants : dict, optional
+            Dictionary that assigns a float value to each constant name used in the expression (i.e. {'L': 0.5}). Default is the empty dict.
+        epsg : int, optional
+            EPSG code of the coordinate system to use (default is None meaning that the EPSG code is read from the first raster file).
+        proj : str, optional
+            Proj4 string of the coordinate system to use (default is the empty string). If a non-empty string is passed, the proj parameter has prevalence over the epsg code.
+        nodata : float, optional
+            Value to be cosidered as absence of data in all the input bands (default is None meaning that the nodata value of each band is read from the raster files).
+        scalemin : float, optional
+            Minimum pixel value to define the range of pixel values mapped to the colorlist colors. Default is 0.0.
+        scalemax : float, optional
+            Maximum pixel value to define the range of pixel values mapped to the colorlist colors. Default is 0.75.
+        colorlist : list of str, optional
+            List of strings defining the colors. Common names of colors can be used (i.e 'red') or their exadecimal RGB representation '#rrggbb'. The default colorlist is a brown-to-green color ramp.
+        scaling : str, optional
+            Scaling mode (one of 'near', 'fast', 'bilinear', 'bicubic', 'spline16', 'spline36', 'hanning', 'hamming', 'hermite', 'kaiser', 'quadric', 'catrom', 'gaussian', 'bessel', 'mitchell', 'sinc', 'lanczos', 'blackman'). Default is 'near'.
+        opacity : float, optional
+            Opacity value (from 0.0 to 1.0) to display raster with partial transparency (default is 1.0, fully opaque).
+        lazy : bool, optional
+            If True, the creation of the instance only records its parameters and the raster files are opened only when the first tile is rendered or the first information on the datasets is requested (default is False).
+
+        Example
+        -------
+        Display of the SAVI index of a Sentinel-2 L2A product and of the NBR index calculated on the bands of two generic raster files::
+
+            # Import libraries
+            from IPython.display import display
+            from vois.geo import Map
+            from geolayer import rasterlayer
+
+            # Create a rasterlayer istance to display the SAVI index on a Sentinel-2 product
+            ly = rasterlayer.expression('(1.0 + L)*(B08 - B04)/(B08 + B04 + L)',
+                                        stacitem='S2A_MSIL2A_20230910T100601_N0509_R022_T32TQP_20230910T161500',
+                                        constants={'L': 0.5},
+                                        scalemin=0.0,
+                                        scalemax=0.8)
+
+            # Create a rasterlayer istance to display the NBR index from two files
+            ly2 = rasterlayer.expression('(nir - swir)/(nir + swir)',
+                                         bands={'nir':  ('.../NIR.tif', 1),
+                                                'swir': ('.../SWIR.tif', 1)},
+                                         nodata=0.0,
+                                         scalemin=-1.0,
+                                         scalemax=1.0)
+
+            # Create a Map
+            m = Map.Map(center=[43.696, 12.1179], zoom=9)
+
+            # Add the layer to the map
+            m.addLayer(ly)
+
+            # Set the identify operation
+            m.onclick = ly.onclick
+
+            # Display the map
+            display(m)
+        """
+        pass
+
+
     # Query Sentinel2 BDAP STAC item if input is a string (i.e. 'S2A_MSIL2A_20230910T100601_N0509_R022_T32TQP_20230910T161500')
     @staticmethod
     def sentinel2item(S2_L2A_Product_ID):
@@ -425,7 +554,41 @@ class rasterlayer:
             Dictionary containing all the metadata information on the Sentinel-2 product (bands, statistics, etc.).
         """
         pass
-    
+
+
+    # Manage the cache of Sentinel-2 bands aligned to the tiles grid
+    @staticmethod
+    def bandCache(maxsize=None, clear=False):
+        """
+        Configure and query the cache of the Sentinel-2 bands aligned to the tiles grid. The bands of a Sentinel-2 product have different native resolutions (i.e. B04 and B08 at 10 m, B11 and B12 at 20 m, B01 at 60 m): when a tile is rendered, each band needed is read and resampled on the grid of the tile only once, and the aligned array is stored in the cache. All the rasterlayer instances that display the same product (created by :py:meth:`~rasterlayer.sentinel2single`, :py:meth:`~rasterlayer.sentinel2rgb`, :py:meth:`~rasterlayer.sentinel2index` and :py:meth:`~rasterlayer.expression`) share the cache, so that a map containing a true color composition, the NDVI and the NBR indices of the same product reads and resamples the B04 band only once for each tile.
+
+        The lower resolution bands are resampled using the method given by the scaling parameter of each rasterlayer instance (nearest neighbour for 'near' and 'fast', bilinear for 'bilinear', cubic for all the other scaling modes). The cache items are identified by the product ID, the band name, the resampling method and the zoom, x and y of the tile, so that rasterlayer instances displaying the same product with different scaling modes never share arrays resampled with a different method. When the cache is full, the least recently used items are discarded.
+
+        Parameters
+        ----------
+        maxsize : int, optional
+            Maximum size in MB of the cache. Default is None, meaning that the current size is not changed (the initial size is 512 MB). Passing 0 disables the cache.
+        clear : bool, optional
+            If True, all the items of the cache are removed (default is False).
+
+        Returns
+        --------
+        info : dict
+            Dictionary containing info on the cache (maxsize, size, items, hits and misses).
+
+        Example
+        -------
+        Increase the size of the cache and display its statistics::
+
+            # Import libraries
+            from IPython.display import display
+            from geolayer import rasterlayer
+
+            info = rasterlayer.bandCache(maxsize=2048)
+            display(info)
+        """
+        pass
+
             
     #####################################################################################################################################################
     # Static methods to get info on a raster file
@@ -435,7 +598,7 @@ class rasterlayer:
     @staticmethod
     def info(filepath):
         """
-        Returns a dict containing info on a raster file.
+        Returns a dict containing info on a raster file. The info on each file is kept in memory for the following calls, identified by the path, the modification time and the size of the file, so that it is calculated again if the file is modified during the session. If the persistent catalog has been enabled by a call to :py:func:`catalog.setup` (it is disabled by default), the info is also stored in the catalog and reused until the file is modified.
         
         Parameters
         ----------
@@ -459,6 +622,77 @@ class rasterlayer:
             
         """
         pass
+
+    
+    # Returns the list of the sources of a VRT file that intersect a bounding box
+    @staticmethod
+    def vrtSources(filepath, bbox=None):
+        """
+        Returns the list of the sources of a VRT file that intersect a bounding box. The VRT file is parsed and a spatial index (R-tree) of the footprints of its sources is built and kept in memory, identified by the path, the modification time and the size of the VRT file. When the VRT file is modified (i.e. sources are added or removed), the index is built again and the cached file handles of its sources are closed. The same index is used when the tiles of a VRT file are rendered: for each tile only the intersecting sources are read, in parallel, and composited, without opening the whole VRT mosaic (see :py:meth:`~rasterlayer.vrtConfig`).
+        
+        Parameters
+        ----------
+        filepath : str
+            Full path of the VRT file.
+        bbox : tuple of 4 floats, optional
+            Bounding box (xmin, ymin, xmax, ymax) in the coordinate system of the VRT file. Default is None, meaning that all the sources are returned.
+        
+        Returns
+        --------
+        sources : list of dicts
+            A list containing a dictionary for each source, with the keys: filepath, band and bbox.
+        
+        Example
+        -------
+        Query the sources of a VRT file that intersect an area::
+        
+            # Import libraries
+            from geolayer import rasterlayer
+    
+            sources = rasterlayer.vrtSources('.../SWF2018/VER1-0/Data/VRT/SWF_2018_005m_03035_V1_0.vrt',
+                                             bbox=(4300000.0, 2700000.0, 4400000.0, 2800000.0))
+            print(len(sources))
+        """
+        pass
+    
+    
+    # Configure the parallel read of the sources of VRT files
+    @staticmethod
+    def vrtConfig(workers=8, maxhandles=256):
+        """
+        Configure the read of the tiles of VRT files. The sources of a VRT file that intersect a tile are read in parallel by a pool of threads, using a pool of file handles that are kept open and reused among tiles and among all the rasterlayer instances.
+        
+        Parameters
+        ----------
+        workers : int, optional
+            Number of threads used to read in parallel the sources of a VRT file that intersect a tile (default is 8). Passing 1 reads the sources sequentially.
+        maxhandles : int, optional
+            Maximum number of source files kept open (default is 256). When this number is reached, the least recently used files are closed.
+        """
+        pass
+
+    
+    # Manage the cache of the coordinate transformation grids
+    @staticmethod
+    def warpCache(maxsize=None, gridsize=16, clear=False):
+        """
+        Configure and query the cache of the coordinate transformation grids used to display rasters having a coordinate system different from the one of the map (i.e. EPSG:3035 or a custom proj string on a Web Mercator map). For each tile, the coordinates are transformed exactly only on the nodes of a sparse grid of gridsize x gridsize points and the other pixels are bilinearly interpolated. The grids are identified by the coordinate system of the raster and by the zoom, x and y of the tile, and they are reused by all the rasterlayer instances and by the identify operations. The coordinate transformation objects are created once for each thread and reused.
+
+        Parameters
+        ----------
+        maxsize : int, optional
+            Maximum number of grids kept in the cache. Default is None, meaning that the current size is not changed (the initial size is 4096). Passing 0 disables the cache.
+        gridsize : int, optional
+            Number of points for each side of the sparse grid where the coordinates are exactly transformed (default is 16). Passing 256 transforms exactly all the pixels of a tile.
+        clear : bool, optional
+            If True, all the items of the cache are removed (default is False).
+
+        Returns
+        --------
+        info : dict
+            Dictionary containing info on the cache (maxsize, items, gridsize, hits and misses).
+        """
+        pass
     
     
     #####################################################################################################################################################
@@ -477,6 +711,36 @@ class rasterlayer:
         """
         pass
         
+        
+    #####################################################################################################################################################
+    # Coverage of valid data
+    #####################################################################################################################################################
+    
+    # Returns a Pillow image of the coverage map of the raster
+    def coverageMask(self):
+        """
+        Returns the coverage map of the raster as a black and white Pillow image: white pixels mark the areas containing valid data, black pixels the areas entirely covered by nodata. The coverage map is built from the overviews of the raster or from the footprints of the sources of a VRT file, it is kept in memory identified by the path, the modification time and the size of the file, and it is built again when the file is modified. It is used to skip the rendering of the tiles that don't intersect valid data (see the coverage parameter of :py:meth:`~rasterlayer.single`).
+        
+        Returns
+        --------
+        img : PIL.Image
+            Pillow image of the coverage map, or None if the coverage map is not available (the raster is neither a VRT file nor has overviews, or the coverage parameter is False).
+
+        Example
+        -------
+        Display the coverage map of a sparse dataset::
+        
+            # Import libraries
+            from IPython.display import display
+            from geolayer import rasterlayer
+
+            ly = rasterlayer.single('.../SWF2018/VER1-0/Data/VRT/SWF_2018_005m_03035_V1_0.vrt', 
+                                    band=1, epsg=3035, nodata=0.0)
+            display(ly.coverageMask())
+        """
+        pass
+        
+        
     #####################################################################################################################################################
     # Symbology management
     #####################################################################################################################################################
@@ -507,7 +771,9 @@ class rasterlayer:
     def colorizer(self,
                   default_mode="linear",
                   default_color="transparent",
-                  epsilon=1.5e-07):
+                  epsilon=1.5e-07,
+                  engine="mapnik",    # "mapnik" or "numpy"
+                  lutsize=4096):      # Number of entries of the lookup table used by the "numpy" engine
         """
         Create a colorizer descriptor to define how the values of a single-band raster are transformed into colors. See the `Raster Colorizer help page <https://github.com/mapnik/mapnik/wiki/RasterColorizer>`_ for more details.
         
@@ -541,6 +807,10 @@ class rasterlayer:
         
         After a rasterlayer instance is created, this method must be called only if a non-default setting is needed. In other words, if the created rasterlayer instance is going to be displayed using the "linear" mode and the "transparent" default color, the call to the colorizer() method can be avoided.
         
+        **Engines**
+        
+        The colors can be assigned to the pixels by the Mapnik RasterColorizer (engine 'mapnik') or by a pure NumPy engine (engine 'numpy') that replicates the same semantics of modes, default color and epsilon, and converts a whole tile into colors in a single vectorized pass. For rasters of integer type whose values fall inside the range [0, lutsize-1] the stops are compiled into a lookup table of *lutsize* entries (one for each possible pixel value) and the pixel values are directly used as indices in the table. For rasters of floating point type (and for integer values outside the table range) the stops are compiled into a piecewise kernel: the stop of each pixel is found by a sorted search on the stop values, the discrete and linear modes are applied exactly at the stop boundaries and the exact mode uses the epsilon of the colorizer, so that the result is identical to the one of the Mapnik RasterColorizer. As in Mapnik, the values lower than the first stop are converted to the default color and the values greater than the last stop take the color of the last stop. The NumPy engine does not require Mapnik and can be tested on arrays of values using the :py:meth:`~rasterlayer.colorize` method.
+        
         Parameters
         ----------
         default_mode : str, optional
@@ -549,6 +819,10 @@ class rasterlayer:
             Starting color of the first step of the colorizer. Default is 'transparent'.
         epsilon : float, optional
             Error threshold used in the exact mode to decide if a pixel value matches a stop value. Default is 1.5e-07.
+        engine : str, optional
+            Engine used to convert pixel values into colors: 'mapnik' or 'numpy'. Default is 'mapnik'.
+        lutsize : int, optional
+            Number of entries of the lookup table compiled by the 'numpy' engine for rasters of integer type (4096 or 65536). Default is 4096. It is not used for rasters of floating point type.
 
         Examples
         --------
@@ -615,13 +889,62 @@ class rasterlayer:
     def colormap(self, values2colors, mode='linear'):
         """
         Add a series of colorizer stops from a dictionary that maps some pixel values to specific colors. Read the description of the method :py:meth:`~rasterlayer.colorizer` for an example.
+        
+        For categorical rasters (i.e. land cover maps having hundreds of classes) the 'categorical' mode can be used: the dictionary is compiled into a palette that directly assigns a color to each integer pixel value, so that no comparison with the stops values is needed, and, unless a different format is explicitly passed to :py:meth:`~rasterlayer.tileLayer`, the tiles are produced as paletted PNG images (3-4 times smaller than RGBA tiles) if the dictionary has at most 255 colors (one palette entry is reserved to the transparent color). The pixel values not present in the dictionary and the nodata value are displayed as transparent. The 'categorical' mode is automatically selected when the 'exact' mode is requested, all the keys of the dictionary are non-negative integers and the raster band has an integer type of 8 or 16 bits (Byte, UInt16, Int16). When the 'categorical' mode is explicitly requested on a dictionary having negative keys (i.e. on an Int16 band), the pixel values are shifted by the minimum key before being used as indices in the palette, and the pixel values lower than the minimum key are displayed as transparent. If an identify_dict is assigned to the rasterlayer instance, the identify operation uses the same palette to convert the pixel values into strings.
 
         Parameters
         ----------
         values2colors : dict
             Dict with pixel values as keys and colors as values.
         mode : str, optional
-            Stop mode: defines how the assignment of colors is implemented. Possible modes are 'discrete', 'exact' or 'linear' (default).
+            Stop mode: defines how the assignment of colors is implemented. Possible modes are 'discrete', 'exact', 'categorical' or 'linear' (default).
+
+        Example
+        -------
+        Display a land cover raster having integer classes::
+
+            ly = rasterlayer.single('...', band=1, epsg=3035, nodata=0.0)
+            ly.colormap({111: '#e6004d',
+                         112: '#ff0000',
+                         211: '#ffffa8',
+                         311: '#80ff00'}, mode='categorical')
+            ly.identify_dict = {111: 'Continuous urban fabric',
+                                112: 'Discontinuous urban fabric',
+                                211: 'Non-irrigated arable land',
+                                311: 'Broad-leaved forest'}
+        """
+        pass
+
+    
+    # Apply the colorizer to an array of pixel values
+    def colorize(self, values):
+        """
+        Convert an array of pixel values into colors by applying the stops of the colorizer with the NumPy engine (see :py:meth:`~rasterlayer.colorizer`). Pixels equal to the nodata value of the rasterlayer instance are converted to the transparent color. This method can be used to compare the colors produced by the NumPy engine with the output of the Mapnik RasterColorizer.
+
+        Parameters
+        ----------
+        values : numpy.ndarray
+            Two-dimensional array of pixel values of shape (height, width).
+
+        Returns
+        --------
+        rgba : numpy.ndarray
+            Array of shape (height, width, 4) and type uint8 containing the red, green, blue and alpha components of the colors assigned to the pixels.
+
+        Example
+        -------
+        Convert an array of values into colors::
+
+            # Import libraries
+            import numpy as np
+            from geolayer import rasterlayer
+
+            ly = rasterlayer.single('...', band=1, epsg=3035, nodata=0.0)
+            ly.colorizer(engine='numpy')
+            ly.colorlist(0.0, 100.0, ['#ff0000', '#0000ff'])
+
+            rgba = ly.colorize(np.linspace(0.0, 100.0, 256*256).reshape((256,256)))
+            print(rgba.shape)
         """
         pass
 
@@ -665,7 +988,7 @@ class rasterlayer:
     @property
     def identify_dict(self):
         """
-        Get/Set the dictionary to be used in the identify operation (click on a pixel) to convert a numerical pixel value into a string description. It can be useful to display class names instead of numerical values when querying categorical raster bands (datasets where each integer value represents a class or category)
+        Get/Set the dictionary to be used in the identify operation (click on a pixel) to convert a numerical pixel value into a string description. It can be useful to display class names instead of numerical values when querying categorical raster bands (datasets where each integer value represents a class or category). When the rasterlayer uses a categorical colormap (see :py:meth:`~rasterlayer.colormap`) the strings are stored in the same table indexed by the pixel values that contains the colors palette.
         
         Returns
         --------
@@ -759,15 +1082,126 @@ class rasterlayer:
         
         
 
+    #####################################################################################################################################################
+    # Export to Cloud Optimized GeoTIFF
+    #####################################################################################################################################################
+    
+    # Save the values or the colors of the rasterlayer in a Cloud Optimized GeoTIFF file
+    def exportCOG(self, filepath, bbox, resolution, epsg=None, styled=False, blocksize=512, compress='DEFLATE', overviews=True, workers=8):
+        """
+        Save the content of the rasterlayer instance inside a bounding box as a Cloud Optimized GeoTIFF file (tiled, compressed and with internal overviews). It is useful to calculate only once the pixels of expensive layers (i.e. those created by :py:meth:`~rasterlayer.sentinel2index` or :py:meth:`~rasterlayer.expression`) and then display the result as a :py:meth:`~rasterlayer.single` rasterlayer.
+
+        The output file is written block by block: the blocks are calculated in parallel and the memory used doesn't depend on the size of the output file.
+
+        Parameters
+        ----------
+        filepath : str
+            Full path of the GeoTIFF file to create.
+        bbox : tuple of 4 floats
+            Bounding box (xmin, ymin, xmax, ymax) of the area to export, in the coordinate system of the output file.
+        resolution : float
+            Size of the pixels of the output file, in the units of its coordinate system.
+        epsg : int, optional
+            EPSG code of the coordinate system of the output file (default is None, meaning the coordinate system of the rasterlayer).
+        styled : bool, optional
+            If True, the colors assigned by the symbology are saved as a 4 bands RGBA Byte file. If False, the calculated pixel values are saved as Float32 bands with the nodata value of the rasterlayer: one band for the layers that display a single band or an index (:py:meth:`~rasterlayer.single`, :py:meth:`~rasterlayer.sentinel2single`, :py:meth:`~rasterlayer.sentinel2index` and :py:meth:`~rasterlayer.expression`), three bands (red, green and blue, before the scaling to [0, 255]) for the RGB compositions (:py:meth:`~rasterlayer.rgb` and :py:meth:`~rasterlayer.sentinel2rgb`). Default is False.
+        blocksize : int, optional
+            Size in pixels of the side of the blocks of the file (default is 512).
+        compress : str, optional
+            Compression method. The lossless methods 'DEFLATE', 'LZW', 'ZSTD' and 'NONE' can always be used. The lossy methods can be used only when styled is True: 'WEBP' saves the 4 bands RGBA file, 'JPEG' saves the red, green and blue bands with an internal mask band for the transparent pixels. A ValueError exception is raised if a lossy method is requested with styled equal to False. Default is 'DEFLATE'.
+        overviews : bool, optional
+            If True, the internal overviews are created (default is True).
+        workers : int, optional
+            Number of threads used to calculate the blocks in parallel (default is 8).
+
+        Example
+        -------
+        Save the NDVI index of a Sentinel-2 product and display the saved file::
+
+            # Import libraries
+            from geolayer import rasterlayer
+
+            ly = rasterlayer.sentinel2index('S2A_MSIL2A_20230910T100601_N0509_R022_T32TQP_20230910T161500',
+                                            band1='B08',
+                                            band2='B04')
+            ly.exportCOG('./ndvi.tif', bbox=(699960.0, 4790220.0, 809760.0, 4900020.0), resolution=10.0, epsg=32632)
+
+            ly2 = rasterlayer.single('./ndvi.tif', band=1, epsg=32632, nodata=999999.0)
+            ly2.colorlist(0.0, 0.75, ['#784519', '#ffb24a', '#ffeda6', '#ade85e', '#87b540', '#039c00', '#016400', '#015000'])
+        """
+        pass
+
+    
+    #####################################################################################################################################################
+    # Instrumentation of the rendering of tiles
+    #####################################################################################################################################################
+    
+    # Set the instrumentation of the rendering of tiles
+    def instrument(self, callback=None, tracefile=None, enabled=True):
+        """
+        Enable the measurement of the rendering of each tile of the rasterlayer instance. The time spent in each stage of the rendering (open of the dataset, read of the pixels, reprojection, colorization and encoding), the bytes read from the raster files and the hits and misses of the caches are recorded for each tile.
+
+        The measures of each tile can be passed to a callback function and written in a file as OpenTelemetry-compatible spans (one JSON object for each line). A summary of the measures collected in the session is returned by the :py:meth:`~rasterlayer.tileStats` method.
+
+        Parameters
+        ----------
+        callback : function, optional
+            Python function called after the rendering of each tile, with a dict as argument containing the keys: zoom, x, y, total (time in milliseconds), stages (dict of times in milliseconds for each stage), counters and cache (dict of hits and misses). Default is None.
+        tracefile : str, optional
+            Path of the file where the spans are appended (default is None).
+        enabled : bool, optional
+            If False, the instrumentation is disabled (default is True).
+
+        Example
+        -------
+        Print the time spent for each tile::
+
+            # Import libraries
+            from geolayer import rasterlayer
+
+            rlayer = rasterlayer.single(...)
+
+            def onTile(measures):
+                print(measures['zoom'], measures['x'], measures['y'], measures['total'])
+
+            rlayer.instrument(callback=onTile, tracefile='./spans.jsonl')
+        """
+        pass
+
+    
+    # Returns a summary of the measures collected on the rendering of tiles
+    def tileStats(self):
+        """
+        Returns a summary of the measures collected by the instrumentation of the rasterlayer instance (see :py:meth:`~rasterlayer.instrument`) since its activation.
+
+        Returns
+        --------
+        stats : dict
+            Dictionary containing the number of tiles rendered, the percentiles of the total rendering times and, for each stage, the total time, the percentage of the total time and the percentiles of its times. The stages are ordered from the most to the least expensive.
+        """
+        pass
+
+    
     #####################################################################################################################################################
     # Create an ipyleaflet.TileLayer
     #####################################################################################################################################################
 
     # Returns an instance of ipyleaflet.TileLayer
-    def tileLayer(self, max_zoom=22):
+    def tileLayer(self, max_zoom=22, format=None, quality=85):
         """
         Creates an ipyleaflet.TileLayer object from an instance of rasterlayer, to be added to a Map for display.
         
+        The tiles can be encoded in different image formats: 'jpeg' is suggested for opaque RGB compositions (see :py:meth:`~rasterlayer.rgb` and :py:meth:`~rasterlayer.sentinel2rgb`) and 'png8' for rasters displayed with a colormap. Empty tiles (fully transparent) and tiles filled by a single color are not encoded: a precomputed image shared by all the tiles is returned instead. The rendering of the tiles is managed by a scheduler that can be configured using the function :py:func:`tiles.scheduler`.
+        
+        Parameters
+        ----------
+        max_zoom : int, optional
+            Maximum zoom level of the tiles (default is 22).
+        format : str, optional
+            Image format of the tiles. Possible values are 'png' (RGBA PNG), 'png8' (8 bits paletted PNG), 'webp' (lossy WebP), 'webp-lossless' (lossless WebP) and 'jpeg'. Default is None, meaning that the rasterlayer instances having a categorical colormap (see :py:meth:`~rasterlayer.colormap`) use 'png8' if the colormap has at most 255 colors, and all the other instances use 'png'. A format passed explicitly always has prevalence over the categorical colormap. The 'jpeg' format does not support transparency: the nodata pixels are displayed in black.
+        quality : int, optional
+            Quality (from 1 to 100) of the lossy formats 'webp' and 'jpeg' (default is 85).
+        
         Returns
         --------
         tlayer : ipyleaflet.TileLayer
@@ -796,5 +1230,36 @@ class rasterlayer:
         """
         pass
 
+    
+    # Returns the URL template of the UTFGrid tiles
+    def utfgrid(self, resolution=4):
+        """
+        Returns the URL template of the `UTFGrid <https://github.com/mapbox/utfgrid-spec>`_ tiles of the rasterlayer instance. Each UTFGrid tile is a JSON document that encodes, for each cell of resolution x resolution pixels of the corresponding image tile, the key of the item displayed in that cell. The keys of the grid are the distinct pixel values of the tile: if an identify_dict is assigned to the layer (see :py:attr:`~rasterlayer.identify_dict`) the data associated to each key is the string of the class, otherwise it is the pixel value formatted as in the identify operation. The UTFGrid tiles are optional: they are rendered only after this method has been called on the instance, and only for the tiles whose grid URL is requested by a client. Each grid is rendered in the same pass of the corresponding image tile and cached with it, so that a client can resolve mouse-over tooltips and clicks locally, without sending identify requests to the server. The instances on which this method is never called don't pay any cost for the grids.
+        
+        Parameters
+        ----------
+        resolution : int, optional
+            Size in pixels of the side of each cell of the grid (default is 4, meaning that each 256x256 image tile corresponds to a grid of 64x64 cells).
+        
+        Returns
+        --------
+        url : str
+            URL template of the UTFGrid tiles, containing the {z}, {x} and {y} placeholders.
+
+        Example
+        -------
+        Add the UTFGrid tiles to an ipyleaflet Map (requires a client-side UTFGrid layer)::
+        
+            # Import libraries
+            from geolayer import rasterlayer
+
+            # Create a rasterlayer instance
+            rlayer = rasterlayer.single(..., identify_dict={1: 'wheat', 2: 'maize'})
+            
+            # URL template of the UTFGrid tiles
+            url = rlayer.utfgrid(resolution=4)
+        """
+        pass
+
         
     
\ No newline at end of file
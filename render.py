@@ -0,0 +1,101 @@
+"""Rendering of static images of rasterlayer and vectorlayer instances"""
+# Author(s): Davide.De-Marchi@ec.europa.eu
+# Copyright © European Union 2026
+# 
+# Licensed under the EUPL, Version 1.2 or as soon they will be approved by 
+# the European Commission subsequent versions of the EUPL (the "Licence");
+# 
+# You may not use this work except in compliance with the Licence.
+# 
+# You may obtain a copy of the Licence at:
+# https://joinup.ec.europa.eu/collection/eupl/eupl-text-eupl-12
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the Licence is distributed on an "AS IS"
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either
+# express or implied.
+# 
+# See the Licence for the specific language governing permissions and
+# limitations under the Licence.
+
+
+
+#####################################################################################################################################################
+# Render an image of a list of layers
+#####################################################################################################################################################
+def render(bbox, width=1024, height=1024, crs=3857, layers=[], background='transparent', output='image'):
+    """
+    Render a single image of a bounding box by compositing a list of rasterlayer and vectorlayer instances, in the order they are passed (the first layer at the bottom). The image is rendered directly at the requested size, without the creation and the stitching of tiles, and without the need of a Map.
+
+    Parameters
+    ----------
+    bbox : tuple of 4 floats
+        Bounding box (xmin, ymin, xmax, ymax) of the image, in the coordinate system passed in the crs parameter.
+    width : int, optional
+        Width of the image in pixels (default is 1024).
+    height : int, optional
+        Height of the image in pixels (default is 1024).
+    crs : int or str, optional
+        EPSG code or proj4 string of the coordinate system of the image (default is 3857, the Web Mercator projection).
+    layers : list, optional
+        List of rasterlayer and vectorlayer instances to render.
+    background : str, optional
+        Background color of the image (default is 'transparent').
+    output : str, optional
+        Type of the result: 'image' for a Pillow image, 'array' for a NumPy array of shape (height, width, 4) and type uint8, or 'png' for the bytes of a PNG image (default is 'image').
+
+    Returns
+    --------
+    img : PIL.Image or numpy.ndarray or bytes
+        The rendered image, in the type requested by the output parameter.
+
+    Example
+    -------
+    Render an image of a raster and a vector layer::
+
+        # Import libraries
+        from IPython.display import display
+        from geolayer import rasterlayer, vectorlayer
+        from geolayer.render import render
+
+        ly = rasterlayer.sentinel2rgb('S2A_MSIL2A_20230910T100601_N0509_R022_T32TQP_20230910T161500')
+        vlayer = vectorlayer.file('.../NUTS_RG_03M_2021_4326_0.shp', epsg=4326)
+
+        img = render((11.5, 43.2, 12.8, 44.1), width=800, height=600, crs=4326, layers=[ly, vlayer])
+        display(img)
+    """
+    pass
+
+
+#####################################################################################################################################################
+# Render many images of a list of layers
+#####################################################################################################################################################
+def renderBatch(bboxes, width=256, height=256, crs=3857, layers=[], background='transparent', folder=None, processes=None):
+    """
+    Render one image for each bounding box of a list, by compositing the same list of rasterlayer and vectorlayer instances (see :py:func:`render.render`). The images are rendered in parallel by a pool of processes, each one receiving the definition of the layers only once.
+
+    Parameters
+    ----------
+    bboxes : list of tuples of 4 floats
+        List of bounding boxes (xmin, ymin, xmax, ymax) of the images, in the coordinate system passed in the crs parameter.
+    width : int, optional
+        Width of the images in pixels (default is 256).
+    height : int, optional
+        Height of the images in pixels (default is 256).
+    crs : int or str, optional
+        EPSG code or proj4 string of the coordinate system of the images (default is 3857, the Web Mercator projection).
+    layers : list, optional
+        List of rasterlayer and vectorlayer instances to render.
+    background : str, optional
+        Background color of the images (default is 'transparent').
+    folder : str, optional
+        Folder where the images are saved as PNG files named with the index of the bounding box in the list (i.e. '00042.png'). Default is None, meaning that the images are returned as a list of NumPy arrays.
+    processes : int, optional
+        Number of processes used to render the images (default is None, meaning one process for each core of the machine).
+
+    Returns
+    --------
+    result : list
+        List of the NumPy arrays of the images, or list of the paths of the saved PNG files if a folder is passed.
+    """
+    pass
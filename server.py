@@ -0,0 +1,122 @@
+"""Standalone tile server for rasterlayer and vectorlayer instances"""
+# Author(s): Davide.De-Marchi@ec.europa.eu
+# Copyright © European Union 2026
+# 
+# Licensed under the EUPL, Version 1.2 or as soon they will be approved by 
+# the European Commission subsequent versions of the EUPL (the "Licence");
+# 
+# You may not use this work except in compliance with the Licence.
+# 
+# You may obtain a copy of the Licence at:
+# https://joinup.ec.europa.eu/collection/eupl/eupl-text-eupl-12
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the Licence is distributed on an "AS IS"
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either
+# express or implied.
+# 
+# See the Licence for the specific language governing permissions and
+# limitations under the Licence.
+
+
+
+#####################################################################################################################################################
+# Registration of the layers to serve
+#####################################################################################################################################################
+
+# Register a rasterlayer or vectorlayer instance to be served with a name
+def register(name, layer):
+    """
+    Register a rasterlayer or vectorlayer instance to be served by the tile server with a name. The tiles of the layer are available at the URL http://host:port/name/{z}/{x}/{y}.png (the extension can be .png, .webp or .jpg, or .mvt for Mapbox Vector Tiles of a vectorlayer instance). The Mapbox Vector Tiles of a vectorlayer contain a single layer named as the registered layer, with the geometries clipped to the tile (plus a buffer of 64 pixels) and, as attributes, the id of each feature and the fields listed in its :py:attr:`vectorlayer.vectorlayer.identify_fields` property. The symbology of the vectorlayer is not included and must be defined by the client. Registering a new layer with an already used name replaces the previous layer.
+
+    Parameters
+    ----------
+    name : str
+        Name of the layer, used in the URL of the tiles.
+    layer : rasterlayer or vectorlayer
+        Instance of the layer to serve.
+    """
+    pass
+
+
+# Returns the dict of the registered layers
+def layers():
+    """
+    Returns a dictionary containing the registered layers, with the names as keys and the rasterlayer or vectorlayer instances as values.
+    """
+    pass
+
+
+#####################################################################################################################################################
+# Run the tile server
+#####################################################################################################################################################
+def serve(host='127.0.0.1', port=8080, maxage=86400, certfile=None, keyfile=None, workers=1, cachesize=1024, cachefile=None, checkinterval=10):
+    """
+    Run an asynchronous HTTP tile server that serves the tiles of the registered layers (see :py:func:`server.register`). The server doesn't require any BDAP service and can be used for testing and for small deployments.
+
+    Each tile is returned with a strong ETag derived from the fingerprint of the layer and with a long Cache-Control header, so that browsers and reverse proxies can cache the tiles. The fingerprint includes the symbology, the rendering parameters and a version of each data source, so that a data source rewritten in place, or a change of symbology, produces new ETags and the clients receive the updated tiles when their cached copies expire or are revalidated. The version of a data source is:
+
+    - for local files, the path, the modification time and the size of each file passed to the layer constructor. For a VRT mosaic only the .vrt file is checked, not its thousands of sources: after rewriting a source file in place, the .vrt file must be touched (which also closes the cached handles of its sources, see :py:meth:`rasterlayer.rasterlayer.vrtSources`) or the layer registered again;
+    - for remote files accessed through /vsicurl/, the ETag or Last-Modified header returned by a HEAD request to the remote server;
+    - for Sentinel-2 products, the product ID, since published products are never modified;
+    - for postgis vectorlayer instances, a version number assigned when the layer is registered: after its tables are modified the layer must be registered again.
+
+    The checks of the data sources are throttled: the result of each check is reused for checkinterval seconds, so that at most one stat call or HEAD request for each data source is executed in each interval, whatever the number of tiles requested.
+
+    Requests having an If-None-Match header equal to the ETag of the tile receive a 304 Not Modified response without rendering the tile. Mapbox Vector Tiles are compressed with brotli or gzip according to the Accept-Encoding header of the request. If a certificate is passed the server uses TLS and supports HTTP/2.
+
+    The tiles can be rendered by more worker processes, so that the rendering scales on all the cores of the machine. The definitions of the registered layers are sent once to all the workers when they start. The workers share a cache of the most requested tiles and a cache of the decoded raster blocks, stored in a memory-mapped file, so that a tile or a block rendered or decoded by one worker is reused by all the others.
+
+    Parameters
+    ----------
+    host : str, optional
+        Address on which the server listens (default is '127.0.0.1').
+    port : int, optional
+        Port on which the server listens (default is 8080).
+    maxage : int, optional
+        Number of seconds the tiles can be cached by the clients, written in the Cache-Control header (default is 86400).
+    certfile : str, optional
+        Path of the certificate file to enable TLS and HTTP/2 (default is None).
+    keyfile : str, optional
+        Path of the private key file of the certificate (default is None).
+    workers : int, optional
+        Number of worker processes that render the tiles (default is 1). Passing 0 starts one worker for each core of the machine.
+    cachesize : int, optional
+        Size in MB of the cache of tiles and decoded raster blocks shared by the workers (default is 1024). Passing 0 disables the shared cache.
+    cachefile : str, optional
+        Path of the file that is memory-mapped to store the shared cache (default is None, meaning that an anonymous shared memory area is used).
+    checkinterval : float, optional
+        Number of seconds during which the version of a data source, used in the ETags, is reused without checking the data source again (default is 10). Passing 0 checks the data sources at each request.
+
+    Example
+    -------
+    Serve a raster and a vector layer::
+
+        # Import libraries
+        from geolayer import rasterlayer, vectorlayer, server
+
+        ly = rasterlayer.single('.../SWF2018/VER1-0/Data/VRT/SWF_2018_005m_03035_V1_0.vrt',
+                                band=1, epsg=3035, nodata=0.0)
+        ly.color(value=1.0, color="#cefc20", mode="exact")
+        server.register('swf', ly)
+
+        vlayer = vectorlayer.file('.../NUTS_RG_03M_2021_4326_0.shp', epsg=4326)
+        server.register('nuts', vlayer)
+
+        # Tiles are available at http://127.0.0.1:8080/swf/{z}/{x}/{y}.png
+        server.serve(port=8080)
+    """
+    pass
+
+
+# Entry point of the "geolayer serve" command
+def main(argv=None):
+    """
+    Entry point of the *geolayer* command. The command *geolayer serve config.py --host 0.0.0.0 --port 8080 --workers 64* executes the Python file config.py, which is expected to create and register the layers to serve (see :py:func:`server.register`), and then runs the tile server (see :py:func:`server.serve`).
+
+    Parameters
+    ----------
+    argv : list of str, optional
+        Command line arguments (default is None, meaning that sys.argv is used).
+    """
+    pass
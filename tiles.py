@@ -0,0 +1,146 @@
+"""Tile rendering services shared by the rasterlayer and vectorlayer classes"""
+# Author(s): Davide.De-Marchi@ec.europa.eu
+# Copyright © European Union 2026
+# 
+# Licensed under the EUPL, Version 1.2 or as soon they will be approved by 
+# the European Commission subsequent versions of the EUPL (the "Licence");
+# 
+# You may not use this work except in compliance with the Licence.
+# 
+# You may obtain a copy of the Licence at:
+# https://joinup.ec.europa.eu/collection/eupl/eupl-text-eupl-12
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the Licence is distributed on an "AS IS"
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either
+# express or implied.
+# 
+# See the Licence for the specific language governing permissions and
+# limitations under the Licence.
+
+
+
+#####################################################################################################################################################
+# Scheduler of the rendering of tiles
+#####################################################################################################################################################
+def scheduler(workers=8, maxqueue=256, coalesce=True, cancel=True, burst=0.1):
+    """
+    Configure the scheduler that renders the tiles requested by the maps for all the rasterlayer and vectorlayer instances (see :py:meth:`rasterlayer.rasterlayer.tileLayer` and :py:meth:`vectorlayer.vectorlayer.tileLayer`).
+
+    The tiles are rendered by a bounded pool of workers. The scheduler doesn't receive the map view from the client: it estimates it from the requests of tiles. The requests of a layer received within *burst* seconds from each other form a burst (a map fires a burst of requests at each pan or zoom); the centroid of the tiles of the most recent burst is used as the center of the map view, and the pending tiles are ordered by their distance from it, so that the tiles in the middle of the screen are rendered first. Identical requests (same layer, zoom, x and y) that arrive while a tile is being rendered are coalesced and receive the same result.
+
+    A pending tile is considered abandoned by the client, and removed from the queue before being rendered, when the connection of its request is closed (Leaflet aborts the loading of the tiles that leave the view) or when a burst of requests at a different zoom level of the same layer arrives after it (the tiles of the previous zoom generation are no longer displayed). A tile whose rendering is already started is completed and stored in the cache.
+
+    Parameters
+    ----------
+    workers : int, optional
+        Number of tiles rendered concurrently (default is 8).
+    maxqueue : int, optional
+        Maximum number of pending tiles (default is 256). When this number is reached, the pending tiles farthest from the center of the map view are discarded.
+    coalesce : bool, optional
+        If True, identical requests of tiles are rendered only once (default is True).
+    cancel : bool, optional
+        If True, the pending tiles that are abandoned by the client are not rendered (default is True).
+    burst : float, optional
+        Maximum interval in seconds between two requests of tiles of the same layer to consider them part of the same burst (default is 0.1).
+
+    Returns
+    --------
+    info : dict
+        Dictionary containing info on the scheduler (workers, maxqueue, pending, running, coalesced and cancelled).
+
+    Example
+    -------
+    Increase the number of workers of the scheduler::
+
+        # Import libraries
+        from IPython.display import display
+        from geolayer import tiles
+
+        info = tiles.scheduler(workers=16)
+        display(info)
+    """
+    pass
+
+
+
+#####################################################################################################################################################
+# Profiling of the rendering of tiles
+#####################################################################################################################################################
+
+# Enable the profiling of the tiles of a layer
+def profile(layer, enabled=True):
+    """
+    Enable the profiling of the rendering of tiles of a rasterlayer or vectorlayer instance. The rendering time and the breakdown in stages of each tile (identified by zoom, x and y) are recorded using the instrumentation of the layer (see :py:meth:`rasterlayer.rasterlayer.instrument` and :py:meth:`vectorlayer.vectorlayer.instrument`). When a tile is rendered more than once, the maximum time is kept.
+
+    Parameters
+    ----------
+    layer : rasterlayer or vectorlayer
+        Instance of the layer to profile.
+    enabled : bool, optional
+        If False, the profiling is disabled and the recorded times are removed (default is True).
+    """
+    pass
+
+
+# Returns a vectorlayer that displays the rendering times of the tiles of a profiled layer
+def heatmap(layer, colorlist=['#ffffb2', '#fecc5c', '#fd8d3c', '#f03b20', '#bd0026'], opacity=0.5):
+    """
+    Returns a vectorlayer instance that displays, as an overlay, the rendering times of the tiles of a layer recorded by the profiling (see :py:func:`tiles.profile`). Each rendered tile is displayed as a polygon colored according to its rendering time, so that the areas of the map where the rendering is expensive (i.e. where a vectorlayer has very complex geometries or a VRT has many overlapping sources) are easily identified. The identify operation on the overlay returns the zoom, x, y and the times of the stages of the tile.
+
+    Parameters
+    ----------
+    layer : rasterlayer or vectorlayer
+        Instance of the profiled layer.
+    colorlist : list of str, optional
+        List of colors assigned to the rendering times, from the fastest to the slowest tiles. The default is a yellow-to-red color ramp.
+    opacity : float, optional
+        Opacity of the fill of the polygons (default is 0.5).
+
+    Returns
+    --------
+    vlayer : vectorlayer
+        Instance of vectorlayer to be added to a Map.
+
+    Example
+    -------
+    Display the heatmap of the rendering times of a layer::
+
+        # Import libraries
+        from IPython.display import display
+        from vois.geo import Map
+        from geolayer import vectorlayer, tiles
+
+        vlayer = vectorlayer.file('.../EuroGlobalMap.gpkg', layer='...')
+        tiles.profile(vlayer)
+
+        m = Map.Map()
+        m.addLayer(vlayer)
+        display(m)
+
+        # After panning and zooming the map, display the heatmap of the rendering times
+        hlayer = tiles.heatmap(vlayer)
+        m.addLayer(hlayer)
+        m.onclick = hlayer.onclick
+    """
+    pass
+
+
+# Returns the slowest tiles of a profiled layer
+def slowest(layer, n=10):
+    """
+    Returns the slowest tiles of a layer recorded by the profiling (see :py:func:`tiles.profile`).
+
+    Parameters
+    ----------
+    layer : rasterlayer or vectorlayer
+        Instance of the profiled layer.
+    n : int, optional
+        Number of tiles to return (default is 10).
+
+    Returns
+    --------
+    tiles : list of dicts
+        List of the slowest tiles ordered by decreasing rendering time. Each dict contains the keys: zoom, x, y, total (time in milliseconds) and stages (dict of times in milliseconds for each stage).
+    """
+    pass
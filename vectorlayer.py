@@ -1,4 +1,7 @@
-"""Display of vector datasets (shapefiles, geopackage, POSTGIS queries and WKT strings) on a ipyleaflet Map"""
+"""Display of vector datasets (shapefiles, geopackage, POSTGIS queries and WKT strings) on a ipyleaflet Map
+
+The heavy dependencies (GDAL/OGR, Mapnik, PIL, ipyvuetify, ipyleaflet, mapclassify and plotly) are not imported when this module is imported: each of them is loaded the first time a method that needs it is called. Processes that only use the identify, layers and layer methods don't pay the import cost of the libraries used for the rendering and the legends.
+"""
 # Author(s): Davide.De-Marchi@ec.europa.eu
 # Copyright © European Union 2022-2024
 # 
@@ -62,10 +65,13 @@ class vectorlayer:
              filepath,      # Path to the file (shapefile or geopackage, etc...)
              layer=None,      # Name of the layer (for a shapefile leave it empty)
              epsg=None,     # If None is passed, the epsg is calculated
-             proj=''):      # To be used for projections that do not have an EPSG code (if not empty it is used instead of the passed epsg)
+             proj='',       # To be used for projections that do not have an EPSG code (if not empty it is used instead of the passed epsg)
+             lazy=False):   # True to delay the opening of the dataset to the first use
         """
         Display of a file-based vector dataset on an ipyleaflet Map.
         
+        If the coordinate system of the dataset is different from the one of the map, each feature is transformed into the coordinate system of the map the first time it is needed by a tile or by an identify operation, and the transformed geometry is stored in a compact form in a cache shared by all the vectorlayer instances that display the same file (with the same modification time and size) in the same coordinate system (see :py:meth:`~vectorlayer.geometryCache`).
+        
         Parameters
         ----------
         filepath : str
@@ -76,6 +82,8 @@ class vectorlayer:
             EPSG code of the coordinate system to use (default is None meaning that the geolayer library will try to understand the EPSG code itself).
         proj : str, optional
             Proj4 string of the coordinate system to use (default is the empty string). If a non-empty string is passed, the proj parameter has prevalence over the epsg code.
+        lazy : bool, optional
+            If True, the creation of the instance only records its parameters and the dataset is opened (and its EPSG code detected) only when the first tile is rendered or the first information on the dataset is requested (default is False).
             
         Example
         -------
@@ -129,7 +137,8 @@ class vectorlayer:
     @classmethod
     def wkt(cls,
             wktlist,          # List of strings containing WKT of geospatial features in EPSG4326
-            properties=[]):   # List of dictionaries containing the attributes of each of the feature (optional)
+            properties=[],    # List of dictionaries containing the attributes of each of the feature (optional)
+            lazy=False):      # True to delay the parsing of the WKT strings to the first use
         """
         Display of one or more WKT (Well-Known-Text) strings as geospatial vector features over an ipyleaflet Map.
         
@@ -139,6 +148,8 @@ class vectorlayer:
             List of strings in WKT format containing the geometry of features to display (see: `Well Known Text format <https://en.wikipedia.org/wiki/Well-known_text_representation_of_geometry>`_).
         properties : list of dict, optional
             List of dict containing attributes of the features (default is []).
+        lazy : bool, optional
+            If True, the creation of the instance only records its parameters and the WKT strings are parsed only when the first tile is rendered or the first information on the features is requested (default is False).
             
         Example
         -------
@@ -199,7 +210,8 @@ class vectorlayer:
                 geomtype='Polygon',
                 geometry_field='',
                 geometry_table='',
-                extents=''):
+                extents='',
+                lazy=False):         # True to delay the connection to the database to the first use
         """
         Display of a POSTGIS geospatial query over an ipyleaflet Map.
         
@@ -231,6 +243,8 @@ class vectorlayer:
             Maximum extent of the geometries in the format "xmin ymin, xmax ymax"; if omitted, the extents will be determined by querying the metadata for the table.
             
             **Important!**: always pass a valid extents string, since this will make the display much faster in most cases.
+        lazy : bool, optional
+            If True, the creation of the instance only records its parameters, and the connection to the database, the detection of the geometry field and table and the query of the extents are executed only when the first tile is rendered or the first identify operation is requested (default is False).
 
 
         Example
@@ -294,7 +308,7 @@ class vectorlayer:
     @staticmethod
     def layers(filepath):
         """
-        Returns the list of layers of a file-based vector dataset (shapefile, geopackage, sqlite, etc.).
+        Returns the list of layers of a file-based vector dataset (shapefile, geopackage, sqlite, etc.). If the persistent catalog has been enabled by a call to :py:func:`catalog.setup` (it is disabled by default), the list is read from the catalog until the file is modified.
         
         Parameters
         ----------
@@ -308,7 +322,7 @@ class vectorlayer:
     @staticmethod
     def layer(filepath, layer=None):
         """
-        Returns a dictionary containing info on a layer of a file-based vector dataset (extent, feature type, feature count, epsg, etc.).
+        Returns a dictionary containing info on a layer of a file-based vector dataset (extent, feature type, feature count, epsg, etc.). The info on each layer is kept in memory for the following calls, identified by the path, the modification time and the size of the file, so that it is calculated again if the file is modified during the session. If the persistent catalog has been enabled by a call to :py:func:`catalog.setup` (it is disabled by default), the info is also stored in the catalog and reused until the file is modified.
         
         Parameters
         ----------
@@ -318,6 +332,27 @@ class vectorlayer:
             Name of the layer. It is possible to pass None in case of a shapefile dataset.
         """
         pass
+
+    
+    # Manage the cache of the geometries transformed into the coordinate system of the map
+    @staticmethod
+    def geometryCache(maxsize=None, clear=False):
+        """
+        Configure and query the cache of the geometries of file-based vector datasets already transformed into the coordinate system of the map. The cache items are identified by the file path, the modification time and the size of the file, the layer name, the coordinate system and the feature id, so that the same vertices are never transformed twice, neither by the rendering of different tiles nor by identify operations. When a file is modified, all the geometries of that file are removed from the cache and transformed again from the new content of the file. When the cache is full, the least recently used geometries are discarded.
+        
+        Parameters
+        ----------
+        maxsize : int, optional
+            Maximum size in MB of the cache. Default is None, meaning that the current size is not changed (the initial size is 256 MB). Passing 0 disables the cache.
+        clear : bool, optional
+            If True, all the items of the cache are removed (default is False).
+
+        Returns
+        --------
+        info : dict
+            Dictionary containing info on the cache (maxsize, size, features, vertices, hits and misses).
+        """
+        pass
     
     
     #####################################################################################################################################################
@@ -839,6 +874,8 @@ class vectorlayer:
         """
         Given in input a geographic coordinate  and a zoom level, returns a string containing info on the attributes of the feature under the (lat,lon) position.
 
+        The feature is searched using a spatial index of the prepared geometries of the layer, with a tolerance in pixels that is converted to map units according to the zoom level (see :py:attr:`~vectorlayer.identify_tolerance`). Only the fields listed in :py:attr:`~vectorlayer.identify_fields` are read and the resulting string is stored in a cache indexed by the id of the feature (see :py:attr:`~vectorlayer.identify_cache`), so that repeated identify operations on the same feature (i.e. on mouse hover) don't query the dataset again.
+
         
         Parameters
         ----------
@@ -912,17 +949,128 @@ class vectorlayer:
     @identify_width.setter
     def identify_width(self, width):
         pass
+
+    
+    @property
+    def identify_tolerance(self):
+        """
+        Get/Set the tolerance in pixels used to find the feature under the position of an identify operation. The tolerance is converted to map units according to the zoom level of the identify operation.
+        
+        Returns
+        --------
+        pixels : int
+            Tolerance in pixels (default is 3)
+
+        Example
+        -------
+        Programmatically change the tolerance of the identify operation::
+            
+            vlayer.identify_tolerance = 5
+            print(vlayer.identify_tolerance)
+        """
+        pass
+        
+    @identify_tolerance.setter
+    def identify_tolerance(self, pixels):
+        pass
+    
+    
+    @property
+    def identify_cache(self):
+        """
+        Get/Set the maximum number of results of identify operations kept in the cache of the vectorlayer instance. The cache is indexed by the id of the identified feature and it is cleared every time the :py:attr:`~vectorlayer.identify_fields` are changed. Setting it to 0 disables the cache.
+        
+        Returns
+        --------
+        n : int
+            Maximum number of results kept in the cache (default is 1000)
+
+        Example
+        -------
+        Programmatically change the size of the identify cache::
+            
+            vlayer.identify_cache = 10000
+            print(vlayer.identify_cache)
+        """
+        pass
+        
+    @identify_cache.setter
+    def identify_cache(self, n):
+        pass
+    
+
+    #####################################################################################################################################################
+    # Instrumentation of the rendering of tiles
+    #####################################################################################################################################################
+    
+    # Set the instrumentation of the rendering of tiles
+    def instrument(self, callback=None, tracefile=None, enabled=True):
+        """
+        Enable the measurement of the rendering of each tile of the vectorlayer instance. The time spent in each stage of the rendering (fetch of the features, reprojection, evaluation of the rules, rendering of the symbols and encoding), the number of features touched and the hits and misses of the caches are recorded for each tile.
+
+        The measures of each tile can be passed to a callback function and written in a file as OpenTelemetry-compatible spans (one JSON object for each line). A summary of the measures collected in the session is returned by the :py:meth:`~vectorlayer.tileStats` method.
+
+        Parameters
+        ----------
+        callback : function, optional
+            Python function called after the rendering of each tile, with a dict as argument containing the keys: zoom, x, y, total (time in milliseconds), stages (dict of times in milliseconds for each stage), counters and cache (dict of hits and misses). Default is None.
+        tracefile : str, optional
+            Path of the file where the spans are appended (default is None).
+        enabled : bool, optional
+            If False, the instrumentation is disabled (default is True).
+
+        Example
+        -------
+        Print the time spent for each tile::
+
+            # Import libraries
+            from geolayer import vectorlayer
+
+            vlayer = vectorlayer.file(...)
+
+            def onTile(measures):
+                print(measures['zoom'], measures['x'], measures['y'], measures['total'])
+
+            vlayer.instrument(callback=onTile, tracefile='./spans.jsonl')
+        """
+        pass
+
     
+    # Returns a summary of the measures collected on the rendering of tiles
+    def tileStats(self):
+        """
+        Returns a summary of the measures collected by the instrumentation of the vectorlayer instance (see :py:meth:`~vectorlayer.instrument`) since its activation.
 
+        Returns
+        --------
+        stats : dict
+            Dictionary containing the number of tiles rendered, the percentiles of the total rendering times and, for each stage, the total time, the percentage of the total time and the percentiles of its times. The stages are ordered from the most to the least expensive.
+        """
+        pass
+
+    
     #####################################################################################################################################################
     # Create an ipyleaflet.TileLayer
     #####################################################################################################################################################
     
     # Returns an instance of ipyleaflet.TileLayer
-    def tileLayer(self, max_zoom=22):
+    def tileLayer(self, max_zoom=22, format='png', quality=85, metatile=1):
         """
         Creates an ipyleaflet.TileLayer object from an instance of vectorlayer, to be added to a Map for display.
         
+        The tiles can be encoded in different image formats: 'png8' or 'webp' are suggested for layers having a limited number of colors. Empty tiles (fully transparent) and tiles filled by a single color are not encoded: a precomputed image shared by all the tiles is returned instead. The rendering of the tiles is managed by a scheduler that can be configured using the function :py:func:`tiles.scheduler`.
+        
+        Parameters
+        ----------
+        max_zoom : int, optional
+            Maximum zoom level of the tiles (default is 22).
+        format : str, optional
+            Image format of the tiles. Possible values are 'png' (RGBA PNG), 'png8' (8 bits paletted PNG), 'webp' (lossy WebP), 'webp-lossless' (lossless WebP) and 'jpeg'. Default is 'png'. The 'jpeg' format does not support transparency: the areas not covered by features are displayed in black.
+        quality : int, optional
+            Quality (from 1 to 100) of the lossy formats 'webp' and 'jpeg' (default is 85).
+        metatile : int, optional
+            Number of tiles for each side of the metatiles (from 2 to 8), or 1 to render each tile separately (default is 1). When a metatile size N greater than 1 is passed, a block of NxN tiles is rendered in a single pass and then sliced into tiles that are all stored in the cache. The fetching of the features, the evaluation of the rules and the setup of the symbols are done once for each block, and the labels are placed without being cut at the borders of the tiles. Values from 2 to 4 are suggested for dense polygon layers.
+        
         Returns
         --------
         tlayer : ipyleaflet.TileLayer
@@ -952,6 +1100,37 @@ class vectorlayer:
         pass
 
     
+    # Returns the URL template of the UTFGrid tiles
+    def utfgrid(self, resolution=4):
+        """
+        Returns the URL template of the `UTFGrid <https://github.com/mapbox/utfgrid-spec>`_ tiles of the vectorlayer instance. Each UTFGrid tile is a JSON document that encodes, for each cell of resolution x resolution pixels of the corresponding image tile, the key of the item displayed in that cell. The keys of the grid are the ids of the features rendered in the tile, and the data associated to each key contains the values of the fields listed in :py:attr:`~vectorlayer.identify_fields`. The UTFGrid tiles are optional: they are rendered only after this method has been called on the instance, and only for the tiles whose grid URL is requested by a client. Each grid is rendered in the same pass of the corresponding image tile and cached with it, so that a client can resolve mouse-over tooltips and clicks locally, without sending identify requests to the server. The instances on which this method is never called don't pay any cost for the grids.
+        
+        Parameters
+        ----------
+        resolution : int, optional
+            Size in pixels of the side of each cell of the grid (default is 4, meaning that each 256x256 image tile corresponds to a grid of 64x64 cells).
+        
+        Returns
+        --------
+        url : str
+            URL template of the UTFGrid tiles, containing the {z}, {x} and {y} placeholders.
+
+        Example
+        -------
+        Add the UTFGrid tiles to an ipyleaflet Map (requires a client-side UTFGrid layer)::
+        
+            # Import libraries
+            from geolayer import vectorlayer
+
+            # Create a vectorlayer instance
+            vlayer = vectorlayer.file(...)
+            
+            # URL template of the UTFGrid tiles
+            url = vlayer.utfgrid(resolution=4)
+        """
+        pass
+
+    
     
 #####################################################################################################################################################
 # Generate an image from a symbol